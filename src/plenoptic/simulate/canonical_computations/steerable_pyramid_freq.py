@@ -5,6 +5,7 @@ Construct a steerable pyramid on matrix two dimensional signals, in the
 Fourier domain.
 """
 
+import functools
 import warnings
 from collections import OrderedDict
 from typing import Literal
@@ -18,7 +19,7 @@ from numpy.typing import NDArray
 from scipy.special import factorial
 from torch import Tensor
 
-from ...tools.signal import interpolate1d, raised_cosine, steer
+from ...tools.signal import _steering_weights, interpolate1d, raised_cosine
 
 complex_types = [torch.cdouble, torch.cfloat]
 
@@ -26,6 +27,78 @@ SCALES_TYPE = int | Literal["residual_lowpass", "residual_highpass"]
 KEYS_TYPE = tuple[int, int] | Literal["residual_lowpass", "residual_highpass"]
 
 
+@functools.lru_cache(maxsize=32)
+def _polar_grid(height: int, width: int) -> tuple[NDArray, NDArray]:
+    """
+    Build the polar coordinates of the frequency grid for a given image size.
+
+    These are the angular and log2-radial coordinates of each point of the
+    fftshifted (DC-centered) frequency grid, from which all the pyramid's
+    masks are interpolated. They depend only on the image size, so the result
+    is cached: constructing many pyramids of the same shape (e.g., in a test
+    suite or a synthesis loop) computes the trigonometry only once.
+
+    Parameters
+    ----------
+    height, width
+        Height and width of the image.
+
+    Returns
+    -------
+    angle
+        Angular coordinate of each frequency, in radians. Read-only, since
+        it is shared across instances.
+    log_rad
+        Log2 of the radial coordinate of each frequency, with the DC value
+        patched to that of its neighbor to avoid ``log2(0)``. Read-only,
+        since it is shared across instances.
+    """
+    ctr = np.ceil((np.array((height, width)) + 0.5) / 2).astype(int)
+
+    (xramp, yramp) = np.meshgrid(
+        np.linspace(-1, 1, width + 1)[:-1],
+        np.linspace(-1, 1, height + 1)[:-1],
+        indexing="xy",
+    )
+
+    angle = np.arctan2(yramp, xramp)
+    log_rad = np.sqrt(xramp**2 + yramp**2)
+    log_rad[ctr[0] - 1, ctr[1] - 1] = log_rad[ctr[0] - 1, ctr[1] - 2]
+    log_rad = np.log2(log_rad)
+    angle.flags.writeable = False
+    log_rad.flags.writeable = False
+    return angle, log_rad
+
+
+def _rfft2_to_full(half_dft: Tensor, width: int) -> Tensor:
+    """
+    Reconstruct a full 2d Fourier spectrum from its non-redundant half.
+
+    :func:`torch.fft.rfft2` only computes the non-negative frequencies along the
+    last dimension, since the spectrum of a real-valued signal is
+    Hermitian-symmetric. This mirrors (and conjugates) the missing columns so
+    the result matches :func:`torch.fft.fft2` of the original signal.
+
+    Parameters
+    ----------
+    half_dft
+        Output of :func:`torch.fft.rfft2`, with ``width // 2 + 1`` columns.
+    width
+        Size of the last dimension of the original (spatial-domain) signal.
+
+    Returns
+    -------
+    full_dft
+        Full spectrum, with ``width`` columns.
+    """
+    # the missing columns are the negative frequencies, which are the complex
+    # conjugate of the positive ones, with both dimensions running in reverse
+    # frequency order (torch.roll puts the zero-frequency row back first).
+    neg_cols = half_dft[..., :, 1 : (width + 1) // 2]
+    neg_cols = torch.roll(torch.flip(neg_cols.conj(), dims=(-2, -1)), 1, dims=-2)
+    return torch.cat([half_dft, neg_cols], dim=-1)
+
+
 class SteerablePyramidFreq(nn.Module):
     r"""
     Steerable frequency pyramid in Torch.
@@ -174,6 +247,12 @@ class SteerablePyramidFreq(nn.Module):
 
         if (self.image_shape[0] % 2 != 0) or (self.image_shape[1] % 2 != 0):
             warnings.warn("Reconstruction will not be perfect with odd-sized images")
+        # for even-sized images, the masks are centered on the DC component
+        # and thus symmetric, which allows us to use the cheaper
+        # Hermitian-aware ffts (rfft2 / irfft2) in the forward pass. for
+        # odd-sized images the mask grid is slightly offset, so we fall back
+        # on the full complex transforms.
+        self._even_shape = all(s % 2 == 0 for s in self.image_shape)
 
         self.is_complex = is_complex
         self.downsample = downsample
@@ -182,14 +261,12 @@ class SteerablePyramidFreq(nn.Module):
             self.fft_norm = "ortho"
         else:
             self.fft_norm = "backward"
-        # cache constants
-        self.lutsize = 1024
-        self.Xcosn = (
-            np.pi
-            * np.array(range(-(2 * self.lutsize + 1), (self.lutsize + 2)))
-            / self.lutsize
-        )
-        self.alpha = (self.Xcosn + np.pi) % (2 * np.pi) - np.pi
+        # constants for the angular masks' lookup table. these (like the polar
+        # grid and radial transition function below) are only needed to build
+        # the masks, so they are not stored on the instance.
+        lutsize = 1024
+        Xcosn = np.pi * np.array(range(-(2 * lutsize + 1), (lutsize + 2))) / lutsize
+        alpha = (Xcosn + np.pi) % (2 * np.pi) - np.pi
 
         max_ht = np.floor(np.log2(min(self.image_shape[0], self.image_shape[1]))) - 2
         if height == "auto":
@@ -217,31 +294,37 @@ class SteerablePyramidFreq(nn.Module):
 
         dims = np.array(self.image_shape)
 
-        # make a grid for the raised cosine interpolation
-        ctr = np.ceil((np.array(dims) + 0.5) / 2).astype(int)
-
-        (xramp, yramp) = np.meshgrid(
-            np.linspace(-1, 1, dims[1] + 1)[:-1],
-            np.linspace(-1, 1, dims[0] + 1)[:-1],
-            indexing="xy",
-        )
-
-        self.angle = np.arctan2(yramp, xramp)
-        log_rad = np.sqrt(xramp**2 + yramp**2)
-        log_rad[ctr[0] - 1, ctr[1] - 1] = log_rad[ctr[0] - 1, ctr[1] - 2]
-        self.log_rad = np.log2(log_rad)
+        # polar frequency grid for the raised cosine interpolation, cached
+        # across instances since it only depends on the image size
+        angle, log_rad = _polar_grid(*self.image_shape)
 
         # radial transition function (a raised cosine in log-frequency):
-        self.Xrcos, Yrcos = raised_cosine(twidth, (-twidth / 2.0), np.array([0, 1]))
-        self.Yrcos = np.sqrt(Yrcos)
-
-        self.YIrcos = np.sqrt(1.0 - self.Yrcos**2)
-
-        # create low and high masks
-        lo0mask = interpolate1d(self.log_rad, self.YIrcos, self.Xrcos)
-        hi0mask = interpolate1d(self.log_rad, self.Yrcos, self.Xrcos)
-        self.register_buffer("lo0mask", torch.as_tensor(lo0mask).unsqueeze(0))
-        self.register_buffer("hi0mask", torch.as_tensor(hi0mask).unsqueeze(0))
+        Xrcos, Yrcos = raised_cosine(twidth, (-twidth / 2.0), np.array([0, 1]))
+        Yrcos = np.sqrt(Yrcos)
+
+        YIrcos = np.sqrt(1.0 - Yrcos**2)
+
+        # create low and high masks. all masks are built on the fftshifted
+        # (DC-centered) grid, but are stored in the standard fft layout (by
+        # applying ifftshift), so that the forward and reconstruction passes
+        # can multiply them directly with un-shifted spectra and skip the
+        # per-call fftshift/ifftshift round-trips, which are pure memory
+        # traffic.
+        lo0mask = interpolate1d(log_rad, YIrcos, Xrcos)
+        hi0mask = interpolate1d(log_rad, Yrcos, Xrcos)
+        # the masks are cheap to rebuild from the init arguments, so none of
+        # them is saved in the state_dict (persistent=False): checkpoints stay
+        # small and hold nothing besides what the user actually optimized
+        self.register_buffer(
+            "lo0mask",
+            torch.as_tensor(np.fft.ifftshift(lo0mask)).unsqueeze(0),
+            persistent=False,
+        )
+        self.register_buffer(
+            "hi0mask",
+            torch.as_tensor(np.fft.ifftshift(hi0mask)).unsqueeze(0),
+            persistent=False,
+        )
 
         # need a mock image to down-sample so that we correctly
         # construct the differently-sized masks
@@ -249,6 +332,11 @@ class SteerablePyramidFreq(nn.Module):
         imdft = np.fft.fftshift(np.fft.fft2(mock_image))
         lodft = imdft * lo0mask
 
+        # the coefficient sizes are fully determined by image_shape, so we
+        # record them once here (tracking lodft through the down-sampling
+        # loop below) instead of rewriting them on every forward call.
+        self.pyr_size["residual_highpass"] = self.image_shape
+
         # this list, used by coarse-to-fine optimization, gives all the
         # scales (including residuals) from coarse to fine
         self.scales = (
@@ -257,66 +345,130 @@ class SteerablePyramidFreq(nn.Module):
             + ["residual_highpass"]
         )
 
-        # we create these copies because they will be modified in the
-        # following loops
-        Xrcos = self.Xrcos.copy()
-        angle = self.angle.copy()
-        log_rad = self.log_rad.copy()
+        # the band-pass filtering in forward() multiplies the low-passed
+        # spectrum by the angle mask, the high-pass mask and (-i)**order, the
+        # Fourier transform of a gaussian derivative of that order. the mask
+        # product is fixed, so we precompute it as a single combined mask per
+        # band (see _bandmasks_scale_{i} below). for even orders (-i)**order
+        # is real (+/-1) and folded into the combined masks too; for odd
+        # orders it is imaginary and stays a scalar applied at run time, so
+        # that all buffers remain real-valued (nn.Module.to() discards the
+        # imaginary part of complex buffers when cast to a real dtype).
+        self._complex_const = complex(0, -1) ** self.order
+        band_sign = 1.0
+        if self.order % 2 == 0:
+            band_sign = self._complex_const.real
+            self._complex_const = 1.0
+        # reconstruction applies the inverse factor, i**order, folded into
+        # the combined recon masks the same way when it is real
+        self._complex_const_recon = complex(0, 1) ** self.order
+        recon_sign = 1.0
+        if self.order % 2 == 0:
+            recon_sign = self._complex_const_recon.real
+            self._complex_const_recon = 1.0
+        # complex tight-frame coefficients were divided by sqrt(2) on
+        # analysis; fold the compensating factor into the recon masks instead
+        # of rescaling every coefficient tensor at run time
+        if self.is_complex and self.tight_frame:
+            recon_sign *= np.sqrt(2)
+        # x-axes of the angular masks' lookup tables, one per orientation.
+        # these are scale-independent, so compute them once up front.
+        Xcosn_shifted = [
+            Xcosn + np.pi * b / self.num_orientations
+            for b in range(self.num_orientations)
+        ]
+        # y-values of the angular masks' lookup table. these only depend on
+        # the order and is_complex, not on the scale, so build them once.
+        const = (
+            (2 ** (2 * self.order))
+            * (factorial(self.order, exact=True) ** 2)
+            / float(self.num_orientations * factorial(2 * self.order, exact=True))
+        )
+        if self.is_complex:
+            Ycosn_forward = (
+                2.0
+                * np.sqrt(const)
+                * (np.cos(Xcosn) ** self.order)
+                * (np.abs(alpha) < np.pi / 2.0).astype(int)
+            )
+            Ycosn_recon = np.sqrt(const) * (np.cos(Xcosn)) ** self.order
+        else:
+            Ycosn_forward = np.sqrt(const) * (np.cos(Xcosn)) ** self.order
+            Ycosn_recon = Ycosn_forward
+
+        if not self.downsample:
+            # without down-sampling, every mask shares the image's shape, so
+            # the whole scale cascade can be collapsed into one mask stack
+            # (see _all_band_masks below). this tracks the running product of
+            # the per-scale lowpass masks and energy-compensation gains.
+            cum_lomask = np.ones(self.image_shape)
+            lo_gain = 2.0 if self.fft_norm != "ortho" else 1.0
+            all_band_masks = []
+
         # pre-generate the angle, hi and lo masks, as well as the
         # indices used for down-sampling.
         self._loindices = []
         for i in range(self.num_scales):
             Xrcos -= np.log2(2)
-            const = (
-                (2 ** (2 * self.order))
-                * (factorial(self.order, exact=True) ** 2)
-                / float(self.num_orientations * factorial(2 * self.order, exact=True))
-            )
 
-            if self.is_complex:
-                Ycosn_forward = (
-                    2.0
-                    * np.sqrt(const)
-                    * (np.cos(self.Xcosn) ** self.order)
-                    * (np.abs(self.alpha) < np.pi / 2.0).astype(int)
-                )
-                Ycosn_recon = np.sqrt(const) * (np.cos(self.Xcosn)) ** self.order
+            # bands at this scale have the same size as the (not yet
+            # down-sampled) low-pass spectrum
+            for b in range(self.num_orientations):
+                self.pyr_size[(i, b)] = tuple(lodft.shape)
 
-            else:
-                Ycosn_forward = np.sqrt(const) * (np.cos(self.Xcosn)) ** self.order
-                Ycosn_recon = Ycosn_forward
+            himask = interpolate1d(log_rad, Yrcos, Xrcos)
 
-            himask = interpolate1d(log_rad, self.Yrcos, Xrcos)
-            self.register_buffer(
-                f"_himasks_scale_{i}", torch.as_tensor(himask).unsqueeze(0)
-            )
+            # the band ffts in _recon_levels run unnormalized ("backward");
+            # for ortho normalization, fold the 1/sqrt(N) factor into the
+            # recon masks so those ffts skip their full-tensor scaling pass
+            recon_norm = recon_sign
+            if self.fft_norm == "ortho":
+                recon_norm = recon_sign / np.sqrt(np.prod(lodft.shape))
 
-            anglemasks = []
-            anglemasks_recon = []
+            bandmasks = []
+            recon_bandmasks = []
             for b in range(self.num_orientations):
-                anglemask = interpolate1d(
-                    angle,
-                    Ycosn_forward,
-                    self.Xcosn + np.pi * b / self.num_orientations,
+                anglemask = interpolate1d(angle, Ycosn_forward, Xcosn_shifted[b])
+                anglemask_recon = interpolate1d(angle, Ycosn_recon, Xcosn_shifted[b])
+                # combined band-pass mask used by forward(): angle mask,
+                # high-pass mask, and the real part of (-i)**order in one
+                # tensor, so the hot loop does a single multiply per band
+                bandmask = band_sign * anglemask * himask
+                bandmasks.append(
+                    torch.as_tensor(np.fft.ifftshift(bandmask)).unsqueeze(0)
                 )
-                anglemask_recon = interpolate1d(
-                    angle,
-                    Ycosn_recon,
-                    self.Xcosn + np.pi * b / self.num_orientations,
+                # the reconstruction applies the same combination (with the
+                # recon angle mask and the inverse phase factor), so combine
+                # those too and spare _recon_levels the extra multiplies
+                recon_bandmask = recon_norm * anglemask_recon * himask
+                recon_bandmasks.append(
+                    torch.as_tensor(np.fft.ifftshift(recon_bandmask)).unsqueeze(0)
                 )
-                anglemasks.append(torch.as_tensor(anglemask).unsqueeze(0))
-                anglemasks_recon.append(torch.as_tensor(anglemask_recon).unsqueeze(0))
 
-            self.register_buffer(f"_anglemasks_scale_{i}", torch.cat(anglemasks))
             self.register_buffer(
-                f"_anglemasks_recon_scale_{i}", torch.cat(anglemasks_recon)
+                f"_bandmasks_scale_{i}", torch.cat(bandmasks), persistent=False
+            )
+            self.register_buffer(
+                f"_recon_bandmasks_scale_{i}",
+                torch.cat(recon_bandmasks),
+                persistent=False,
             )
             if not self.downsample:
-                lomask = interpolate1d(log_rad, self.YIrcos, Xrcos)
+                lomask = interpolate1d(log_rad, YIrcos, Xrcos)
                 self.register_buffer(
-                    f"_lomasks_scale_{i}", torch.as_tensor(lomask).unsqueeze(0)
+                    f"_lomasks_scale_{i}",
+                    torch.as_tensor(np.fft.ifftshift(lomask)).unsqueeze(0),
+                    persistent=False,
+                )
+                self._loindices.append([dims - dims // 2, dims // 2])
+                # effective one-shot mask for this scale's bands: the combined
+                # bandpass masks times every lowpass mask (and gain) that the
+                # cascade would have applied before reaching this scale
+                all_band_masks.append(
+                    getattr(self, f"_bandmasks_scale_{i}")
+                    * torch.as_tensor(np.fft.ifftshift(cum_lomask))
                 )
-                self._loindices.append([np.array([0, 0]), dims])
+                cum_lomask = cum_lomask * lomask * lo_gain
                 lodft = lodft * lomask
 
             else:
@@ -327,30 +479,147 @@ class SteerablePyramidFreq(nn.Module):
                 loctr = np.ceil((lodims + 0.5) / 2).astype(int)
                 lostart = ctr - loctr
                 loend = lostart + lodims
-                self._loindices.append([lostart, loend])
+                # in the standard (non-fftshifted) layout used at run time, the
+                # retained frequencies sit in the corners: the first
+                # ``loend - dims // 2`` indices (DC and positive frequencies)
+                # and the last ``dims // 2 - lostart`` ones (negative
+                # frequencies) along each axis.
+                self._loindices.append([loend - dims // 2, dims // 2 - lostart])
 
                 # subsample indices
                 log_rad = log_rad[lostart[0] : loend[0], lostart[1] : loend[1]]
                 angle = angle[lostart[0] : loend[0], lostart[1] : loend[1]]
 
-                lomask = interpolate1d(log_rad, self.YIrcos, Xrcos)
+                lomask = interpolate1d(log_rad, YIrcos, Xrcos)
                 self.register_buffer(
-                    f"_lomasks_scale_{i}", torch.as_tensor(lomask).unsqueeze(0)
+                    f"_lomasks_scale_{i}",
+                    torch.as_tensor(np.fft.ifftshift(lomask)).unsqueeze(0),
+                    persistent=False,
                 )
                 # subsampling
                 lodft = lodft[lostart[0] : loend[0], lostart[1] : loend[1]]
                 # convolution in spatial domain
                 lodft = lodft * lomask
 
+        self.pyr_size["residual_lowpass"] = tuple(lodft.shape)
+
+        if not self.downsample:
+            # stack of all (scale, band) effective masks, ordered scale-major,
+            # letting forward() filter every band with a single multiply and
+            # one batched inverse fft. the cumulative lowpass mask plays the
+            # same role for the lowpass residual.
+            self.register_buffer(
+                "_all_band_masks", torch.cat(all_band_masks), persistent=False
+            )
+            self.register_buffer(
+                "_lomask_cumulative",
+                torch.as_tensor(np.fft.ifftshift(cum_lomask)).unsqueeze(0),
+                persistent=False,
+            )
+
         # reasonable default dtype
         self.to(torch.float32)
         # This model has no trainable parameters, so it's always in eval mode
         self.eval()
 
+    def _ifft2_real(self, dft: Tensor) -> Tensor:
+        """
+        Compute the real part of the inverse 2d Fourier transform.
+
+        When the masked spectrum is Hermitian-symmetric (which holds for
+        even-sized images, whose masks are symmetric about the DC component),
+        this uses :func:`torch.fft.irfft2` on the non-redundant half of the
+        spectrum, which is roughly half the work of a full complex ifft2.
+        Otherwise, it falls back on the full transform and discards the
+        imaginary part.
+
+        Parameters
+        ----------
+        dft
+            Fourier spectrum, in the standard (non-fftshifted) layout.
+
+        Returns
+        -------
+        signal
+            Real-valued spatial-domain signal of the same height and width.
+        """
+        if self._even_shape:
+            return fft.irfft2(
+                dft[..., : dft.shape[-1] // 2 + 1],
+                s=tuple(dft.shape[-2:]),
+                dim=(-2, -1),
+                norm=self.fft_norm,
+            )
+        return fft.ifft2(dft, dim=(-2, -1), norm=self.fft_norm).real
+
+    def _forward_one_shot(
+        self,
+        lodft: Tensor,
+        scale_ints: list[int],
+        bands: list[int] | None,
+    ) -> OrderedDict:
+        """
+        Compute all requested bands of a non-downsampled pyramid at once.
+
+        When ``downsample=False``, the masks of every scale share the image's
+        shape, so the per-scale lowpass cascade can be folded into each band's
+        mask at construction (see ``_all_band_masks``). This filters all
+        requested ``(scale, band)`` pairs with a single multiply against that
+        stack and recovers them with one batched inverse fft, avoiding the
+        Python loop over scales.
+
+        Parameters
+        ----------
+        lodft
+            Spectrum of the input after the initial lowpass mask, of shape
+            ``(batch, channel, height, width)``.
+        scale_ints
+            Requested scales, sorted, each within ``[0, num_scales)``.
+        bands
+            Requested orientations, each within ``[0, num_orientations)``, or
+            None to include all of them.
+
+        Returns
+        -------
+        pyr_coeffs
+            Coefficients of the requested ``(scale, band)`` pairs, ordered
+            from fine to coarse.
+        """
+        pyr_coeffs = OrderedDict()
+        if bands is None:
+            bands = list(range(self.num_orientations))
+        keys = [(s, b) for s in scale_ints for b in bands]
+        allmasks = self._all_band_masks
+        indices = [s * self.num_orientations + b for s, b in keys]
+        if indices != list(range(allmasks.shape[0])):
+            # only pay for the requested scales and orientations. the masks
+            # must also be gathered when every band is requested but in a
+            # non-canonical order, so they stay aligned with keys.
+            allmasks = allmasks[indices]
+        # for odd orders, (-i)**order is imaginary and applied as a scalar
+        # (for even orders it is real and folded into the masks)
+        banddfts = self._complex_const * lodft if self._complex_const != 1.0 else lodft
+        banddfts = banddfts.unsqueeze(2) * allmasks
+        # for real pyramids the bands' spectra are Hermitian, so irfft2 of
+        # their non-redundant half is equivalent to (and cheaper than) taking
+        # the real part of the full ifft2.
+        if not self.is_complex:
+            bandims = self._ifft2_real(banddfts)
+        else:
+            bandims = fft.ifft2(banddfts, dim=(-2, -1), norm=self.fft_norm)
+            # the input is real, so to maintain a tight frame the complex
+            # bands' magnitudes must be divided by sqrt(2)
+            if self.tight_frame:
+                bandims = bandims / np.sqrt(2)
+        for key, band in zip(keys, bandims.unbind(2)):
+            pyr_coeffs[key] = band
+        return pyr_coeffs
+
     def forward(
         self,
         x: Tensor,
         scales: list[SCALES_TYPE] | None = None,
+        bands: list[int] | None = None,
     ) -> OrderedDict:
         r"""
         Generate the steerable pyramid coefficients for an image.
@@ -373,6 +642,11 @@ class SteerablePyramidFreq(nn.Module):
             'residual_lowpass'. Can contain a single value or multiple values.
             If it's an int, we include all orientations from that scale. Order
             within the list does not matter.
+        bands
+            Which orientation bands to include at each returned scale. If
+            None, we include all orientations. Otherwise, can contain a subset
+            of the ints from 0 up to ``self.order``. Residuals are unaffected
+            by this argument.
 
         Returns
         -------
@@ -420,102 +694,130 @@ class SteerablePyramidFreq(nn.Module):
             assert (max(scale_ints) < self.num_scales) and (min(scale_ints) >= 0), (
                 "Scales must be within 0 and num_scales-1"
             )
-        angle = self.angle.copy()
-        log_rad = self.log_rad.copy()
-        lo0mask = self.lo0mask.clone()
-        hi0mask = self.hi0mask.clone()
+        if bands is not None and len(bands) != 0:
+            assert (max(bands) < self.num_orientations) and (min(bands) >= 0), (
+                "Bands must be within 0 and order"
+            )
+        # the masks are fixed at construction and only ever read (all the
+        # multiplies below are out-of-place), so no defensive clone is needed
+        lo0mask = self.lo0mask
+        hi0mask = self.hi0mask
 
         # x is a torch tensor batch of images of size (batch, channel, height,
         # width)
         assert len(x.shape) == 4, "Input must be batch of images of shape BxCxHxW"
 
-        imdft = fft.fft2(x, dim=(-2, -1), norm=self.fft_norm)
-        imdft = fft.fftshift(imdft)
+        # x is real-valued, so we only need to compute the non-redundant half
+        # of its spectrum and can mirror the rest, which is cheaper than a full
+        # fft2. the masks are stored in this same standard (non-fftshifted)
+        # layout, so no further shifting is needed.
+        imdft = _rfft2_to_full(
+            fft.rfft2(x, dim=(-2, -1), norm=self.fft_norm), x.shape[-1]
+        )
 
         if "residual_highpass" in scales:
-            # high-pass
-            hi0dft = imdft * hi0mask
-            hi0 = fft.ifftshift(hi0dft)
-            hi0 = fft.ifft2(hi0, dim=(-2, -1), norm=self.fft_norm)
-            pyr_coeffs["residual_highpass"] = hi0.real
-            self.pyr_size["residual_highpass"] = tuple(hi0.real.shape[-2:])
+            # high-pass. because the highpass mask is real and symmetric, the
+            # masked spectrum stays Hermitian and irfft2 on its non-redundant
+            # half recovers the real part directly.
+            hi0 = self._ifft2_real(imdft * hi0mask)
+            pyr_coeffs["residual_highpass"] = hi0
 
         # input to the next scale is the low-pass filtered component
         lodft = imdft * lo0mask
 
+        if not self.downsample:
+            # without down-sampling, all masks share the image's shape, so
+            # every requested (scale, band) pair is filtered with one multiply
+            # against the precomputed effective-mask stack and recovered with
+            # a single batched inverse fft, instead of looping over scales.
+            band_idx = list(bands) if bands is not None else None
+            if len(scale_ints) != 0:
+                pyr_coeffs.update(
+                    self._forward_one_shot(lodft, sorted(scale_ints), band_idx)
+                )
+            if "residual_lowpass" in scales:
+                pyr_coeffs["residual_lowpass"] = self._ifft2_real(
+                    lodft * self._lomask_cumulative
+                )
+            return pyr_coeffs
+
         for i in range(self.num_scales):
             if i in scales:
-                # high-pass mask is selected based on the current scale
-                himask = getattr(self, f"_himasks_scale_{i}")
-                # compute filter output at each orientation
-                for b in range(self.num_orientations):
-                    # band pass filtering is done in the fourier space as multiplying
-                    #  by the fft of a gaussian derivative.
-                    # The oriented dft is computed as a product of the fft of the
-                    # low-passed component, the precomputed anglemask (specifies
-                    # orientation), and the precomputed hipass mask (creating a bandpass
-                    # filter) the complex_const variable comes from the Fourier
-                    # transform of a gaussian derivative.
-                    # Based on the order of the gaussian, this constant changes.
-
-                    anglemask = getattr(self, f"_anglemasks_scale_{i}")[b]
-
-                    complex_const = np.power(complex(0, -1), self.order)
-                    banddft = complex_const * lodft * anglemask * himask
-                    # fft output is then shifted to center frequencies
-                    band = fft.ifftshift(banddft)
-                    # ifft is applied to recover the filtered representation in spatial
-                    # domain
-                    band = fft.ifft2(band, dim=(-2, -1), norm=self.fft_norm)
-
-                    # for real pyramid, take the real component of the complex band
-                    if not self.is_complex:
-                        pyr_coeffs[(i, b)] = band.real
-                    else:
-                        # Because the input signal is real, to maintain a tight frame
-                        # if the complex pyramid is used, magnitudes need to be divided
-                        # by sqrt(2) because energy is doubled.
-
-                        if self.tight_frame:
-                            band = band / np.sqrt(2)
-                        pyr_coeffs[(i, b)] = band
-                    self.pyr_size[(i, b)] = tuple(band.shape[-2:])
-
-            if not self.downsample:
-                # no subsampling of angle and rad
-                # just use lo0mask
-                lomask = getattr(self, f"_lomasks_scale_{i}")
-                lodft = lodft * lomask
-
-                # Since we don't subsample here, if we are not using
-                # orthonormalization that we need to manually account for the
-                # subsampling, so that energy in each band remains the same
-                # the energy is cut by factor of 4 so we need to scale magnitudes
-                # by factor of 2.
-
-                if self.fft_norm != "ortho":
-                    lodft = 2 * lodft
-            else:
-                # subsample indices
-                lostart, loend = self._loindices[i]
-
-                log_rad = log_rad[lostart[0] : loend[0], lostart[1] : loend[1]]
-                angle = angle[lostart[0] : loend[0], lostart[1] : loend[1]]
-
-                # subsampling of the dft for next scale
-                lodft = lodft[:, :, lostart[0] : loend[0], lostart[1] : loend[1]]
-                # low-pass filter mask is selected
-                lomask = getattr(self, f"_lomasks_scale_{i}")
-                # again multiply dft by subsampled mask (convolution in spatial domain)
+                # band pass filtering is done in the fourier space as
+                # multiplying by the fft of a gaussian derivative. each
+                # precomputed bandmask combines the anglemask (specifies
+                # orientation), the hipass mask (creating a bandpass filter)
+                # and the real part of the Fourier transform of that gaussian
+                # derivative, (-i)**order. for odd orders, (-i)**order is
+                # imaginary and applied here as a scalar.
+                bandmasks = getattr(self, f"_bandmasks_scale_{i}")
+                if bands is not None:
+                    # only pay for the requested orientations
+                    bandmasks = bandmasks[bands]
+                if self._complex_const != 1.0:
+                    banddfts = self._complex_const * lodft
+                else:
+                    banddfts = lodft
+                # stack all orientations along a new dimension, so that all
+                # bands of this scale are computed with a single (batched)
+                # inverse fft instead of one fft call per orientation
+                banddfts = banddfts.unsqueeze(2) * bandmasks
+
+                # for real pyramid, we only want the real component of the
+                # complex bands. the bands' spectra are Hermitian in that
+                # case, so irfft2 of their non-redundant half is equivalent
+                # to (and cheaper than) taking the real part of the full
+                # ifft2.
+                if not self.is_complex:
+                    bandims = self._ifft2_real(banddfts)
+                else:
+                    # ifft is applied to recover the filtered representation in
+                    # spatial domain
+                    bandims = fft.ifft2(banddfts, dim=(-2, -1), norm=self.fft_norm)
+                    # Because the input signal is real, to maintain a tight frame
+                    # if the complex pyramid is used, magnitudes need to be divided
+                    # by sqrt(2) because energy is doubled.
+
+                    if self.tight_frame:
+                        bandims = bandims / np.sqrt(2)
+                band_idx = bands if bands is not None else range(self.num_orientations)
+                for b, band in zip(band_idx, bandims.unbind(2)):
+                    pyr_coeffs[(i, b)] = band
+
+            # if neither a coarser scale nor the lowpass residual was
+            # requested, the rest of the low-pass cascade would go unused
+            if not any(
+                s in scales
+                for s in [*range(i + 1, self.num_scales), "residual_lowpass"]
+            ):
+                break
+
+            # subsampling of the dft for next scale: in the standard fft
+            # layout the retained frequencies are in the corners, i.e. the
+            # first npos (DC and positive) and last nneg (negative) indices
+            # along each axis.
+            npos, nneg = self._loindices[i]
+            nrow, ncol = lodft.shape[-2:]
+            lodft = torch.cat(
+                [lodft[..., : npos[0], :], lodft[..., nrow - nneg[0] :, :]],
+                dim=-2,
+            )
+            lodft = torch.cat(
+                [lodft[..., :, : npos[1]], lodft[..., :, ncol - nneg[1] :]],
+                dim=-1,
+            )
+            # low-pass filter mask is selected
+            lomask = getattr(self, f"_lomasks_scale_{i}")
+            # again multiply dft by subsampled mask (convolution in spatial domain)
 
-                lodft = lodft * lomask
+            lodft = lodft * lomask
 
         if "residual_lowpass" in scales:
-            # compute residual lowpass when height <=1
-            lo0 = fft.ifftshift(lodft)
-            lo0 = fft.ifft2(lo0, dim=(-2, -1), norm=self.fft_norm)
-            pyr_coeffs["residual_lowpass"] = lo0.real
-            self.pyr_size["residual_lowpass"] = tuple(lo0.real.shape[-2:])
+            # compute residual lowpass when height <=1. like the highpass
+            # residual, the lowpass spectrum is Hermitian, so irfft2 on its
+            # non-redundant half gives the real part directly.
+            lo0 = self._ifft2_real(lodft)
+            pyr_coeffs["residual_lowpass"] = lo0
 
         return pyr_coeffs
 
@@ -599,31 +901,35 @@ class SteerablePyramidFreq(nn.Module):
         pyr_keys = list(pyr_coeffs.keys())
         test_band = pyr_coeffs[pyr_keys[0]]
         num_channels = test_band.size(1)
-        coeff_list = []
-        for ch in range(num_channels):
-            coeff_list_resid = []
-            coeff_list_bands = []
-            for k in pyr_keys:
-                coeffs = pyr_coeffs[k][:, ch : (ch + 1), ...]
-                if "residual" in k:
-                    coeff_list_resid.append(coeffs)
-                else:
-                    if (coeffs.dtype in complex_types) and split_complex:
-                        coeff_list_bands.extend([coeffs.real, coeffs.imag])
-                    else:
-                        coeff_list_bands.append(coeffs)
-
-            if "residual_highpass" in pyr_coeffs:
-                coeff_list_bands.insert(0, coeff_list_resid[0])
-                if "residual_lowpass" in pyr_coeffs:
-                    coeff_list_bands.append(coeff_list_resid[1])
-            elif "residual_lowpass" in pyr_coeffs:
-                coeff_list_bands.append(coeff_list_resid[0])
+        # gather the full multi-channel coefficients per band (in the desired
+        # band order), concatenate once, and interleave the channels
+        # afterwards with a single rearrange; this avoids slicing and copying
+        # each (channel, band) pair separately.
+        coeff_list_resid = []
+        coeff_list_bands = []
+        for k in pyr_keys:
+            coeffs = pyr_coeffs[k]
+            if "residual" in k:
+                coeff_list_resid.append(coeffs)
+            elif (coeffs.dtype in complex_types) and split_complex:
+                coeff_list_bands.extend([coeffs.real, coeffs.imag])
+            else:
+                coeff_list_bands.append(coeffs)
 
-            coeff_list.extend(coeff_list_bands)
+        if "residual_highpass" in pyr_coeffs:
+            coeff_list_bands.insert(0, coeff_list_resid[0])
+            if "residual_lowpass" in pyr_coeffs:
+                coeff_list_bands.append(coeff_list_resid[1])
+        elif "residual_lowpass" in pyr_coeffs:
+            coeff_list_bands.append(coeff_list_resid[0])
 
         try:
-            pyr_tensor = torch.cat(coeff_list, dim=1)
+            pyr_tensor = torch.cat(coeff_list_bands, dim=1)
+            if num_channels > 1:
+                # go from band-major to channel-major ordering
+                pyr_tensor = rearrange(
+                    pyr_tensor, "b (n c) h w -> b (c n) h w", c=num_channels
+                )
             pyr_info = tuple([num_channels, split_complex, pyr_keys])
         except RuntimeError:
             raise RuntimeError(
@@ -974,7 +1280,6 @@ class SteerablePyramidFreq(nn.Module):
                 dim=(-2, -1),
                 norm=self.fft_norm,
             )
-            hidft = fft.fftshift(hidft)
 
             # output dft is the sum of the recondft from the recursive
             # function times the lomask (low pass component) with the
@@ -983,11 +1288,9 @@ class SteerablePyramidFreq(nn.Module):
         else:
             outdft = recondft * lo0mask
 
-        # get output reconstruction by inverting the fft
-        reconstruction = fft.ifftshift(outdft)
-        reconstruction = fft.ifft2(reconstruction, dim=(-2, -1), norm=self.fft_norm)
-
-        # get real part of reconstruction (if complex)
+        # get output reconstruction by inverting the fft (and taking the real
+        # part, if complex)
+        reconstruction = fft.ifft2(outdft, dim=(-2, -1), norm=self.fft_norm)
         reconstruction = reconstruction.real
 
         return reconstruction
@@ -1028,37 +1331,45 @@ class SteerablePyramidFreq(nn.Module):
                     dim=(-2, -1),
                     norm=self.fft_norm,
                 )
-                lodft = fft.fftshift(lodft)
             else:
-                lodft = fft.fft2(
-                    torch.zeros_like(pyr_coeffs["residual_lowpass"]),
-                    dim=(-2, -1),
-                    norm=self.fft_norm,
+                # an excluded residual contributes nothing; return its zero
+                # spectrum directly rather than transforming a zero tensor
+                res = pyr_coeffs["residual_lowpass"]
+                lodft = torch.zeros_like(
+                    res, dtype=torch.promote_types(res.dtype, torch.complex64)
                 )
 
             return lodft
 
-        # Reconstruct from orientation bands
-        # update himask
-        himask = getattr(self, f"_himasks_scale_{scale}")
-        orientdft = torch.zeros_like(pyr_coeffs[(scale, 0)])
-
-        for b in range(self.num_orientations):
-            if (scale, b) in recon_keys:
-                anglemask = getattr(self, f"_anglemasks_recon_scale_{scale}")[b]
-                coeffs = pyr_coeffs[(scale, b)]
-                if self.tight_frame and self.is_complex:
-                    coeffs = coeffs * np.sqrt(2)
-
-                banddft = fft.fft2(coeffs, dim=(-2, -1), norm=self.fft_norm)
-                banddft = fft.fftshift(banddft)
-
-                complex_const = np.power(complex(0, 1), self.order)
-                banddft = complex_const * banddft * anglemask * himask
-                orientdft = orientdft + banddft
-
-        # get the bounding box indices for the low-pass component
-        lostart, loend = self._loindices[scale]
+        # Reconstruct from orientation bands. each precomputed recon bandmask
+        # combines the recon angle mask, the hipass mask and the real part of
+        # the inverse phase factor i**order; for odd orders that factor is
+        # imaginary and applied as a scalar.
+        bandmasks = getattr(self, f"_recon_bandmasks_scale_{scale}")
+        # the orientation bands and the upsampled coarser scales accumulate
+        # in-place into a single output spectrum, rather than allocating (and
+        # then summing) one full-size complex tensor per contribution
+        cdtype = torch.promote_types(pyr_coeffs[(scale, 0)].dtype, torch.complex64)
+        recondft = torch.zeros_like(pyr_coeffs[(scale, 0)], dtype=cdtype)
+
+        recon_bs = [b for b in range(self.num_orientations) if (scale, b) in recon_keys]
+        if len(recon_bs) != 0:
+            # stack the requested orientations along a new dimension, so all
+            # bands of this scale go through a single (batched) fft instead of
+            # one fft call per orientation
+            stacked = torch.stack([pyr_coeffs[(scale, b)] for b in recon_bs], dim=2)
+            # norm is "backward" regardless of self.fft_norm: the ortho
+            # 1/sqrt(N) factor is folded into the recon masks at build time
+            banddfts = fft.fft2(stacked, dim=(-2, -1), norm="backward")
+            if self._complex_const_recon != 1.0:
+                banddfts = self._complex_const_recon * banddfts
+            if len(recon_bs) != self.num_orientations:
+                bandmasks = bandmasks[recon_bs]
+            recondft += (banddfts * bandmasks).sum(2)
+
+        # get the number of retained (positive and negative) frequencies of
+        # the low-pass component along each axis
+        npos, nneg = self._loindices[scale]
 
         # create lowpass mask
         lomask = getattr(self, f"_lomasks_scale_{scale}")
@@ -1069,13 +1380,19 @@ class SteerablePyramidFreq(nn.Module):
         # dft at each level by factor of 2 to account for the scaling in the forward
         if (not self.tight_frame) and (not self.downsample):
             reslevdft = reslevdft / 2
-        # create output for reconstruction result
-        resdft = torch.zeros_like(pyr_coeffs[(scale, 0)], dtype=torch.complex64)
 
-        # place upsample and convolve lowpass component
-        resdft[:, :, lostart[0] : loend[0], lostart[1] : loend[1]] = reslevdft * lomask
-        recondft = resdft + orientdft
-        # add orientation interpolated and added images to the lowpass image
+        # place upsample and convolve lowpass component. in the standard fft
+        # layout, the low-pass component's frequencies go in the corners of
+        # the larger spectrum, on top of the orientation bands already
+        # accumulated there.
+        lodft = reslevdft * lomask
+        nrow, ncol = recondft.shape[-2:]
+        recondft[..., : npos[0], : npos[1]] += lodft[..., : npos[0], : npos[1]]
+        recondft[..., : npos[0], ncol - nneg[1] :] += lodft[..., : npos[0], npos[1] :]
+        recondft[..., nrow - nneg[0] :, : npos[1]] += lodft[..., npos[0] :, : npos[1]]
+        recondft[..., nrow - nneg[0] :, ncol - nneg[1] :] += lodft[
+            ..., npos[0] :, npos[1] :
+        ]
         return recondft
 
     def steer_coeffs(
@@ -1142,6 +1459,11 @@ class SteerablePyramidFreq(nn.Module):
         resteering_weights = {}
         num_scales = self.num_scales
         num_orientations = self.num_orientations
+        # steering is a linear combination of the orientation bands and the
+        # weights do not depend on the scale, so compute the weights for all
+        # angles up front and steer each scale with a single matrix multiply
+        angles_col = np.reshape([float(a) for a in angles], (-1, 1))
+        weights = _steering_weights(angles_col, num_orientations, even_phase=even_phase)
         for i in range(num_scales):
             basis = torch.cat(
                 [
@@ -1150,11 +1472,12 @@ class SteerablePyramidFreq(nn.Module):
                 ],
                 dim=-1,
             )
+            weights_t = torch.as_tensor(weights, dtype=basis.dtype).to(basis.device)
+            res = basis @ weights_t.t()
 
-            for j, a in enumerate(angles):
-                res, steervect = steer(basis, a, even_phase=even_phase)
-                resteering_weights[(i, j)] = steervect
-                resteered_coeffs[(i, num_orientations + j)] = res.reshape(
+            for j in range(len(angles)):
+                resteering_weights[(i, j)] = weights_t[j]
+                resteered_coeffs[(i, num_orientations + j)] = res[..., j].reshape(
                     pyr_coeffs[(i, 0)].shape
                 )
 
@@ -1,15 +1,46 @@
 """Convolution-related utility functions."""  # numpydoc ignore=ES01
 
+import functools
 import math
 from typing import Literal
 
-import numpy as np
 import pyrtools as pt
 import torch
 import torch.nn.functional as F
 from torch import Tensor
 
 
+@functools.lru_cache(maxsize=32)
+def _named_filter_1d(filtname: str, dtype: torch.dtype, device: torch.device) -> Tensor:
+    """
+    Fetch a named 1d filter, as a tensor.
+
+    :func:`blur_downsample` and :func:`upsample_blur` apply the outer product
+    of a named 1d filter with itself, which :func:`correlate_downsample` and
+    :func:`upsample_convolve` implement as two separable 1d passes. The filter
+    is fixed given its name, so the result is cached per dtype and device:
+    repeated calls (e.g., at every scale of a Laplacian pyramid, on every
+    synthesis iteration) skip the pyrtools lookup and the host-to-device copy.
+
+    Parameters
+    ----------
+    filtname
+        Name of the filter. See :func:`~pyrtools.pyramids.filters.named_filter`
+        for options.
+    dtype
+        Data type of the returned tensor.
+    device
+        Device of the returned tensor.
+
+    Returns
+    -------
+    filt
+        1d filter tensor.
+    """
+    f = pt.named_filter(filtname).flatten()
+    return torch.as_tensor(f, dtype=dtype, device=device)
+
+
 def correlate_downsample(
     image: Tensor,
     filt: Tensor,
@@ -27,7 +58,10 @@ def correlate_downsample(
         Image, or batch of images, of shape (batch, channel, height, width).
         Batches and channels are handled independently.
     filt
-        2D tensor defining the filter to correlate with the input ``image``.
+        2D tensor defining the filter to correlate with the input ``image``. If
+        1D, the filter is treated as separable: correlating with it along each
+        axis in turn, which is equivalent to (and cheaper than) correlating
+        with its outer product with itself.
     padding_mode
         How to pad the image, so that we return an image of the appropriate size. The
         option ``"constant"`` means padding with zeros.
@@ -51,14 +85,58 @@ def correlate_downsample(
     """
     if image.ndim != 4:
         raise ValueError(f"image must be 4d but has {image.ndim} dimensions instead!")
-    if filt.ndim != 2:
-        raise ValueError(f"filt must be 2d but has {filt.ndim} dimensions instead!")
-    assert image.ndim == 4 and filt.ndim == 2
+    if filt.ndim not in (1, 2):
+        raise ValueError(
+            f"filt must be 1d or 2d but has {filt.ndim} dimensions instead!"
+        )
     n_channels = image.shape[1]
-    image_padded = same_padding(image, kernel_size=filt.shape, pad_mode=padding_mode)
+    kernel_size = (filt.shape[0], filt.shape[0]) if filt.ndim == 1 else filt.shape
+    pad_h = _get_same_padding(image.shape[-2], kernel_size[0], 1, 1)
+    pad_w = _get_same_padding(image.shape[-1], kernel_size[1], 1, 1)
+    if padding_mode == "constant" and pad_h % 2 == 0 and pad_w % 2 == 0:
+        # symmetric zero padding can be fused into the convolution itself,
+        # skipping the separate F.pad allocation
+        if filt.ndim == 1:
+            downsampled = F.conv2d(
+                image,
+                filt.view(1, 1, -1, 1).expand(n_channels, -1, -1, -1),
+                stride=(2, 1),
+                padding=(pad_h // 2, 0),
+                groups=n_channels,
+            )
+            return F.conv2d(
+                downsampled,
+                filt.view(1, 1, 1, -1).expand(n_channels, -1, -1, -1),
+                stride=(1, 2),
+                padding=(0, pad_w // 2),
+                groups=n_channels,
+            )
+        return F.conv2d(
+            image,
+            filt.view(1, 1, *filt.shape).expand(n_channels, -1, -1, -1),
+            stride=2,
+            padding=(pad_h // 2, pad_w // 2),
+            groups=n_channels,
+        )
+    image_padded = same_padding(image, kernel_size=kernel_size, pad_mode=padding_mode)
+    if filt.ndim == 1:
+        # separable filter: two 1d passes cost 2K multiplies per output pixel
+        # instead of the K**2 of the equivalent 2d correlation
+        downsampled = F.conv2d(
+            image_padded,
+            filt.view(1, 1, -1, 1).expand(n_channels, -1, -1, -1),
+            stride=(2, 1),
+            groups=n_channels,
+        )
+        return F.conv2d(
+            downsampled,
+            filt.view(1, 1, 1, -1).expand(n_channels, -1, -1, -1),
+            stride=(1, 2),
+            groups=n_channels,
+        )
     return F.conv2d(
         image_padded,
-        filt.repeat(n_channels, 1, 1, 1),
+        filt.view(1, 1, *filt.shape).expand(n_channels, -1, -1, -1),
         stride=2,
         groups=n_channels,
     )
@@ -85,7 +163,10 @@ def upsample_convolve(
         This should contain two integers of value 0 or 1, which determines whether
         the output height and width should be even (0) or odd (1).
     filt
-        2D tensor defining the filter to correlate with the input ``image``.
+        2D tensor defining the filter to correlate with the input ``image``. If
+        1D, the filter is treated as separable: convolving with it along each
+        axis in turn, which is equivalent to (and cheaper than) convolving
+        with its outer product with itself.
     padding_mode
         How to pad the image, so that we return an image of the appropriate size. The
         option ``"constant"`` means padding with zeros.
@@ -109,25 +190,52 @@ def upsample_convolve(
     """
     if image.ndim != 4:
         raise ValueError(f"image must be 4d but has {image.ndim} dimensions instead!")
-    if filt.ndim != 2:
-        raise ValueError(f"filt must be 2d but has {filt.ndim} dimensions instead!")
-    filt = filt.flip((0, 1))
+    if filt.ndim not in (1, 2):
+        raise ValueError(
+            f"filt must be 1d or 2d but has {filt.ndim} dimensions instead!"
+        )
+    separable = filt.ndim == 1
+    if separable:
+        filt = filt.flip(0)
+        kernel_shape = (filt.shape[0], filt.shape[0])
+    else:
+        filt = filt.flip((0, 1))
+        kernel_shape = filt.shape
 
     n_channels = image.shape[1]
-    pad_start = torch.as_tensor(filt.shape) // 2
-    pad_end = torch.as_tensor(filt.shape) - torch.as_tensor(odd) - pad_start
+    pad_start = torch.as_tensor(kernel_shape) // 2
+    pad_end = torch.as_tensor(kernel_shape) - torch.as_tensor(odd) - pad_start
     pad = torch.as_tensor([pad_start[1], pad_end[1], pad_start[0], pad_end[0]])
     image_prepad = F.pad(image, tuple(pad // 2), mode=padding_mode)
-    image_upsample = F.conv_transpose2d(
-        image_prepad,
-        weight=torch.ones(
-            (n_channels, 1, 1, 1), device=image.device, dtype=image.dtype
-        ),
-        stride=2,
-        groups=n_channels,
+    # zero-insertion upsampling: scatter the samples on the even grid
+    # positions of a zero tensor, which is cheaper than the equivalent
+    # strided conv_transpose with a 1x1 kernel of ones
+    nrow, ncol = image_prepad.shape[-2:]
+    image_upsample = torch.zeros(
+        (*image_prepad.shape[:-2], 2 * nrow - 1, 2 * ncol - 1),
+        device=image.device,
+        dtype=image.dtype,
     )
+    image_upsample[..., ::2, ::2] = image_prepad
     image_postpad = F.pad(image_upsample, tuple(pad % 2))
-    return F.conv2d(image_postpad, filt.repeat(n_channels, 1, 1, 1), groups=n_channels)
+    if separable:
+        # separable filter: two 1d passes cost 2K multiplies per output pixel
+        # instead of the K**2 of the equivalent 2d convolution
+        upsampled = F.conv2d(
+            image_postpad,
+            filt.view(1, 1, -1, 1).expand(n_channels, -1, -1, -1),
+            groups=n_channels,
+        )
+        return F.conv2d(
+            upsampled,
+            filt.view(1, 1, 1, -1).expand(n_channels, -1, -1, -1),
+            groups=n_channels,
+        )
+    return F.conv2d(
+        image_postpad,
+        filt.view(1, 1, *filt.shape).expand(n_channels, -1, -1, -1),
+        groups=n_channels,
+    )
 
 
 def blur_downsample(
@@ -181,10 +289,11 @@ def blur_downsample(
     """
     if n_scales < 1:
         raise ValueError("n_scales must be positive!")
-    f = pt.named_filter(filtname)
-    filt = torch.as_tensor(np.outer(f, f), dtype=image.dtype, device=image.device)
+    filt = _named_filter_1d(filtname, image.dtype, image.device)
     if scale_filter:
-        filt = filt / 2
+        # the filter is applied twice (once per axis), so scaling the 2d
+        # outer product by 1/2 scales each 1d factor by 1/sqrt(2)
+        filt = filt / math.sqrt(2)
     for _ in range(n_scales):
         image = correlate_downsample(image, filt)
     return image
@@ -245,10 +354,11 @@ def upsample_blur(
     """
     if n_scales < 1:
         raise ValueError("n_scales must be positive!")
-    f = pt.named_filter(filtname)
-    filt = torch.as_tensor(np.outer(f, f), dtype=image.dtype, device=image.device)
+    filt = _named_filter_1d(filtname, image.dtype, image.device)
     if scale_filter:
-        filt = filt * 2
+        # the filter is applied twice (once per axis), so scaling the 2d
+        # outer product by 2 scales each 1d factor by sqrt(2)
+        filt = filt * math.sqrt(2)
     for _ in range(n_scales):
         image = upsample_convolve(image, odd, filt)
     return image
@@ -168,6 +168,83 @@ def polar_to_rectangular(amplitude: Tensor, phase: Tensor) -> Tensor:
     return torch.complex(real, imaginary)
 
 
+def _steering_weights(
+    angle: np.ndarray,
+    num: int,
+    harmonics: np.ndarray | None = None,
+    steermtx: Tensor | np.ndarray | None = None,
+    even_phase: bool = True,
+) -> np.ndarray:
+    """
+    Compute the steering weights for each of the specified angles.
+
+    This is the weight-computation core of :func:`steer`, exposed separately
+    so that callers steering the same basis to many angles (e.g.,
+    :meth:`~plenoptic.simulate.SteerablePyramidFreq.steer_coeffs`) can get all
+    the weights in one call and apply them with a single matrix multiply.
+
+    Parameters
+    ----------
+    angle
+        Column vector of angles (in radians) to steer to.
+    num
+        Number of elements in the steerable basis.
+    harmonics
+        A list of harmonic numbers indicating the angular harmonic content of
+        the basis. If ``None``, will use N even or odd low frequencies, as for
+        derivative filters.
+    steermtx
+        Matrix which maps the filters onto Fourier series components. If
+        ``None``, assumes cosine phase harmonic components, and filter
+        positions at ``2pi*n/N``.
+    even_phase
+        Specifies whether the harmonics are cosine or sine phase aligned about
+        those positions.
+
+    Returns
+    -------
+    steervect
+        Array with one row of ``num`` steering weights per angle.
+
+    Raises
+    ------
+    ValueError
+        If ``harmonics`` is not 1d.
+    ValueError
+        If ``harmonics`` is not compatible with ``num``.
+    """
+    # If HARMONICS is not specified, assume derivatives.
+    if harmonics is None:
+        harmonics = np.arange(1 - (num % 2), num, 2)
+
+    if len(harmonics.shape) == 1 or harmonics.shape[0] == 1:
+        # reshape to column matrix
+        harmonics = harmonics.reshape(harmonics.shape[0], 1)
+    elif harmonics.shape[0] != 1 and harmonics.shape[1] != 1:
+        raise ValueError("input parameter HARMONICS must be 1D!")
+
+    if 2 * harmonics.shape[0] - (harmonics == 0).sum() != num:
+        raise ValueError("harmonics list is incompatible with basis size!")
+
+    # If STEERMTX not passed, assume evenly distributed cosine-phase filters:
+    if steermtx is None:
+        steermtx = steer_to_harmonics_mtx(
+            harmonics, np.pi * np.arange(num) / num, even_phase=even_phase
+        )
+
+    steervect = np.zeros((angle.shape[0], num))
+    arg = angle * harmonics[np.nonzero(harmonics)[0]].T
+    if all(harmonics):
+        steervect[:, range(0, num, 2)] = np.cos(arg)
+        steervect[:, range(1, num, 2)] = np.sin(arg)
+    else:
+        steervect[:, 0] = 1
+        steervect[:, range(1, num, 2)] = np.cos(arg)
+        steervect[:, range(2, num, 2)] = np.sin(arg)
+
+    return np.dot(steervect, steermtx)
+
+
 def steer(
     basis: Tensor,
     angle: np.ndarray | Tensor | float,
@@ -228,36 +305,7 @@ def steer(
                 "size of the basis elements"
             )
 
-    # If HARMONICS is not specified, assume derivatives.
-    if harmonics is None:
-        harmonics = np.arange(1 - (num % 2), num, 2)
-
-    if len(harmonics.shape) == 1 or harmonics.shape[0] == 1:
-        # reshape to column matrix
-        harmonics = harmonics.reshape(harmonics.shape[0], 1)
-    elif harmonics.shape[0] != 1 and harmonics.shape[1] != 1:
-        raise ValueError("input parameter HARMONICS must be 1D!")
-
-    if 2 * harmonics.shape[0] - (harmonics == 0).sum() != num:
-        raise ValueError("harmonics list is incompatible with basis size!")
-
-    # If STEERMTX not passed, assume evenly distributed cosine-phase filters:
-    if steermtx is None:
-        steermtx = steer_to_harmonics_mtx(
-            harmonics, np.pi * np.arange(num) / num, even_phase=even_phase
-        )
-
-    steervect = np.zeros((angle.shape[0], num))
-    arg = angle * harmonics[np.nonzero(harmonics)[0]].T
-    if all(harmonics):
-        steervect[:, range(0, num, 2)] = np.cos(arg)
-        steervect[:, range(1, num, 2)] = np.sin(arg)
-    else:
-        steervect[:, 0] = np.ones((arg.shape[0], 1))
-        steervect[:, range(1, num, 2)] = np.cos(arg)
-        steervect[:, range(2, num, 2)] = np.sin(arg)
-
-    steervect = np.dot(steervect, steermtx)
+    steervect = _steering_weights(angle, num, harmonics, steermtx, even_phase)
 
     steervect = torch.as_tensor(steervect, dtype=basis.dtype).to(device)
     if steervect.shape[0] > 1:
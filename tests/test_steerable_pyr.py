@@ -478,6 +478,39 @@ class TestSteerablePyramid:
         with pytest.raises(Exception):
             spyr.recon_pyr(scales)
 
+    @pytest.mark.parametrize("bands", [[0], [3], [0, 2], [3, 0, 1, 2]])
+    @pytest.mark.parametrize(
+        "spyr",
+        [f"auto-3-{c}-{d}-False" for c, d in product([True, False], [True, False])],
+        indirect=True,
+    )
+    def test_bands_arg(self, img, spyr, bands):
+        pyr_coeffs = spyr.forward(img)
+        reduced_pyr_coeffs = spyr.forward(img, bands=bands)
+        # residuals are always included; each scale keeps exactly the
+        # requested orientations, in the requested order
+        expected_keys = (
+            ["residual_highpass"]
+            + [(s, b) for s in range(spyr.num_scales) for b in bands]
+            + ["residual_lowpass"]
+        )
+        assert list(reduced_pyr_coeffs.keys()) == expected_keys
+        for k, v in reduced_pyr_coeffs.items():
+            # allclose rather than exact equality: the reduced forward
+            # batches its ffts over fewer bands, which can reorder float32
+            # accumulations
+            if not torch.allclose(v, pyr_coeffs[k], rtol=1e-6, atol=1e-5):
+                raise Exception(
+                    "Reduced pyr_coeffs should match the full forward, but at"
+                    f" least key {k} does not"
+                )
+
+    @pytest.mark.parametrize("bands", [[-1], [4], [0, 4]])
+    @pytest.mark.parametrize("spyr", ["auto-3-False-True-False"], indirect=True)
+    def test_bands_arg_invalid(self, img, spyr, bands):
+        with pytest.raises(AssertionError, match="Bands must be within"):
+            spyr.forward(img, bands=bands)
+
     @pytest.mark.parametrize("height", range(-1, 8))
     def test_height_values(self, img, height):
         if height < 0:
@@ -516,10 +549,9 @@ class TestSteerablePyramid:
         for s in range(pyr.num_scales):
             names.extend(
                 [
-                    f"_himasks_scale_{s}",
                     f"_lomasks_scale_{s}",
-                    f"_anglemasks_scale_{s}",
-                    f"_anglemasks_recon_scale_{s}",
+                    f"_bandmasks_scale_{s}",
+                    f"_recon_bandmasks_scale_{s}",
                 ]
             )
         assert len(buffers) == len(names), (